@@ -7,8 +7,15 @@ import sys
 import subprocess
 import threading
 import tempfile
+import shutil
+import io
 import os
+import re
 import json
+import struct
+import hashlib
+import functools
+from pathlib import Path
 from PyQt6.QtWidgets import (
     QApplication,
     QMainWindow,
@@ -26,7 +33,15 @@ from PyQt6.QtWidgets import (
     QScrollArea,
     QLineEdit,
 )
-from PyQt6.QtCore import Qt, QSize, QThread, pyqtSignal, QTimer
+from PyQt6.QtCore import (
+    Qt,
+    QSize,
+    QObject,
+    QRunnable,
+    QThreadPool,
+    pyqtSignal,
+    QTimer,
+)
 from PyQt6.QtGui import QFont, QAction, QIcon, QTextCursor, QKeySequence, QShortcut
 
 # Config file path
@@ -46,53 +61,370 @@ DEFAULT_SETTINGS = {
 MODELS_DEFAULT = ["tiny", "base", "small", "medium", "large"]
 MODELS_OPENVINO = ["tiny", "base", "small", "medium"]
 
+# Spool recordings on tmpfs when available so audio I/O never hits a disk
+SPOOL_DIR = "/dev/shm" if os.path.isdir("/dev/shm") else "/tmp"
+
+# Stylesheets assigned on state transitions, hoisted so the strings are
+# built once instead of on every toggle
+STYLE_RECORD_IDLE = (
+    "background-color: #4CAF50; color: white; border-radius: 10px; padding: 15px; min-width: 200px;"
+)
+STYLE_RECORD_ACTIVE = (
+    "background-color: #f44336; color: white; border-radius: 10px; padding: 15px; min-width: 200px;"
+)
+STYLE_STATUS_READY = "color: gray;"
+STYLE_STATUS_ERROR = "color: red;"
+STYLE_STATUS_BUSY = "color: blue;"
+STYLE_STATUS_WARN = "color: orange;"
+STYLE_STATUS_OK = "color: green;"
+
+
+# Parsed settings cache, invalidated when the config file's mtime changes
+_SETTINGS_CACHE = None
+_SETTINGS_MTIME = None
+
 
 def load_settings():
     """Load settings from config file"""
-    if os.path.exists(CONFIG_FILE):
-        try:
-            with open(CONFIG_FILE, "r") as f:
-                settings = json.load(f)
-                return {**DEFAULT_SETTINGS, **settings}
-        except:
-            pass
-    return DEFAULT_SETTINGS.copy()
+    global _SETTINGS_CACHE, _SETTINGS_MTIME
+    try:
+        mtime = os.stat(CONFIG_FILE).st_mtime
+    except FileNotFoundError:
+        # The file is gone; don't let a stale cache outlive it
+        _SETTINGS_CACHE = None
+        _SETTINGS_MTIME = None
+        return DEFAULT_SETTINGS.copy()
+
+    if _SETTINGS_CACHE is not None and mtime == _SETTINGS_MTIME:
+        return _SETTINGS_CACHE.copy()
+
+    try:
+        with open(CONFIG_FILE, "r", buffering=131072) as f:
+            settings = json.load(f)
+        _SETTINGS_CACHE = {**DEFAULT_SETTINGS, **settings}
+        _SETTINGS_MTIME = mtime
+        return _SETTINGS_CACHE.copy()
+    except:
+        return DEFAULT_SETTINGS.copy()
 
 
 def save_settings(settings):
-    """Save settings to config file"""
+    """Save settings to config file (skipped when nothing changed)"""
+    global _SETTINGS_CACHE, _SETTINGS_MTIME
+    # Only skip the write if the file actually still holds these settings;
+    # it may have been removed externally since the cache was filled
+    if settings == _SETTINGS_CACHE and os.path.exists(CONFIG_FILE):
+        return
     os.makedirs(CONFIG_DIR, exist_ok=True)
-    with open(CONFIG_FILE, "w") as f:
+    with open(CONFIG_FILE, "w", buffering=131072) as f:
         json.dump(settings, f, indent=2)
+    _SETTINGS_CACHE = settings.copy()
+    _SETTINGS_MTIME = os.stat(CONFIG_FILE).st_mtime
+
+
+def _wav_header(pcm_len, channels=2, rate=44100, bits=16):
+    """Minimal 44-byte RIFF/WAVE header for raw PCM (arecord -f cd defaults)"""
+    byte_rate = rate * channels * bits // 8
+    block_align = channels * bits // 8
+    return struct.pack(
+        "<4sI4s4sIHHIIHH4sI",
+        b"RIFF",
+        36 + pcm_len,
+        b"WAVE",
+        b"fmt ",
+        16,
+        1,  # PCM
+        channels,
+        rate,
+        byte_rate,
+        block_align,
+        bits,
+        b"data",
+        pcm_len,
+    )
+
+
+# Shared OpenCC converter, built once (constructor parses dictionary files)
+_OPENCC_CONVERTER = None
+
+
+def _get_t2s():
+    """Return the shared Traditional->Simplified converter, building it lazily"""
+    global _OPENCC_CONVERTER
+    if _OPENCC_CONVERTER is None:
+        import opencc
+
+        _OPENCC_CONVERTER = opencc.OpenCC("t2s")
+    return _OPENCC_CONVERTER
+
+
+@functools.lru_cache(maxsize=128)
+def _t2s_convert(text):
+    """Memoized Traditional->Simplified conversion (utterances often repeat)"""
+    return _get_t2s().convert(text)
+
+
+# Absolute tool paths, resolved once in main() after the PATH fixup so
+# each spawn skips the execvp PATH walk
+WHISPER_CLI = None
+ARECORD = None
+
+# Model files that have been seen on disk (they don't move at runtime, so
+# only positive results are cached; a missing model is re-checked)
+_MODEL_SEEN = set()
+
+
+def _model_exists(model_path):
+    """os.path.exists with a cache for model files already found"""
+    if model_path in _MODEL_SEEN:
+        return True
+    if os.path.exists(model_path):
+        _MODEL_SEEN.add(model_path)
+        return True
+    return False
+
+
+def _prefetch_model(model_path):
+    """Hint the kernel to read the model into the page cache ahead of use
+
+    Runs on a background thread at startup so the multi-hundred-MB model is
+    (mostly) cache-warm by the time the first recording ends, instead of
+    being faulted in during the first whisper-cli run.
+    """
+    try:
+        with open(model_path, "rb", buffering=0) as f:
+            os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_WILLNEED)
+    except (OSError, AttributeError):
+        pass
+
+
+# On-disk transcript cache, keyed by audio content hash + model + language
+CACHE_DIR = os.path.expanduser("~/.cache/whisper-im/transcribe")
+_CACHE_MAX_ENTRIES = 500
+
+
+def _audio_digest(audio_file):
+    """Content hash of a recording (BLAKE2 is faster than sha1/md5)"""
+    with open(audio_file, "rb") as f:
+        return hashlib.blake2b(f.read(), digest_size=16).hexdigest()
+
+
+def _trim_cache():
+    """Drop the oldest cached transcripts beyond the size cap"""
+    try:
+        with os.scandir(CACHE_DIR) as it:
+            entries = [(e.stat().st_mtime, e.path) for e in it if e.is_file()]
+    except FileNotFoundError:
+        return
+    if len(entries) <= _CACHE_MAX_ENTRIES:
+        return
+    entries.sort()
+    for _, path in entries[: len(entries) - _CACHE_MAX_ENTRIES]:
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+
+# Cache of whisper-cli --stdin-mode support, keyed by binary path
+_STDIN_MODE_SUPPORT = {}
+
+
+def _stdin_mode_supported(whisper_cli):
+    """Check (and cache) whether whisper-cli supports --stdin-mode"""
+    if whisper_cli not in _STDIN_MODE_SUPPORT:
+        try:
+            result = subprocess.run(
+                [whisper_cli, "--help"],
+                capture_output=True,
+                text=True,
+                timeout=10,
+            )
+            _STDIN_MODE_SUPPORT[whisper_cli] = "stdin-mode" in (
+                result.stdout + result.stderr
+            )
+        except Exception:
+            _STDIN_MODE_SUPPORT[whisper_cli] = False
+    return _STDIN_MODE_SUPPORT[whisper_cli]
 
 
-class TranscribeWorker(QThread):
-    """Worker thread for transcription"""
+class WhisperDaemon(QObject):
+    """Long-lived whisper-cli --stdin-mode process reused across transcriptions
 
-    finished = pyqtSignal(str)
-    error = pyqtSignal(str)
+    Keeps the GGML model loaded between utterances so each transcription only
+    pays inference cost, not model load + backend init. Falls back to the
+    one-shot subprocess path in TranscribeTask when unsupported.
+    """
 
-    def __init__(self, audio_file, models_dir, model, threads, language, backend="default"):
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.process = None
+        self._lock = threading.Lock()
+
+    def start(self, models_dir, model, threads, language, backend="default"):
+        """Start the daemon process, return True if it came up ready"""
+        self.stop()
+
+        whisper_cli = WHISPER_CLI or shutil.which("whisper-cli")
+        if not whisper_cli or not _stdin_mode_supported(whisper_cli):
+            return False
+
+        models_dir = models_dir if models_dir else "whisper.cpp/models"
+        model_path = os.path.join(models_dir, f"ggml-{model}.bin")
+        if not _model_exists(model_path):
+            return False
+
+        cmd = [
+            whisper_cli,
+            "--stdin-mode",
+            "-m",
+            model_path,
+            "-t",
+            threads,
+            "-l",
+            language,
+            "-np",
+        ]
+        if backend == "openvino":
+            cmd.extend(["-oved", "CPU"])
+
+        try:
+            self.process = subprocess.Popen(
+                cmd,
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+                text=True,
+            )
+            # Daemon announces readiness with a JSON status line
+            ready_line = self.process.stdout.readline()
+            if json.loads(ready_line).get("status") != "ready":
+                self.stop()
+                return False
+        except Exception:
+            self.stop()
+            return False
+        return True
+
+    def is_alive(self):
+        return self.process is not None and self.process.poll() is None
+
+    def transcribe(self, audio_file):
+        """Send one audio file path and block for its JSON result line"""
+        with self._lock:
+            self.process.stdin.write(audio_file + "\n")
+            self.process.stdin.flush()
+            line = self.process.stdout.readline()
+        if not line:
+            raise RuntimeError("whisper daemon exited unexpectedly")
+        return json.loads(line).get("text", "").strip()
+
+    def stop(self):
+        if self.process is not None:
+            if self.process.poll() is None:
+                self.process.terminate()
+                try:
+                    self.process.wait(timeout=5)
+                except subprocess.TimeoutExpired:
+                    self.process.kill()
+                    self.process.wait()
+            self.process = None
+
+
+class TranscribeTask(QRunnable):
+    """Pooled worker task for transcription"""
+
+    class Signals(QObject):
+        # QRunnable is not a QObject, so signals live on a companion object
+        partial = pyqtSignal(str)
+        finished = pyqtSignal(str)
+        error = pyqtSignal(str)
+
+    def __init__(self, audio_files, models_dir, model, threads, language, backend="default", daemon=None, whisper_cli=None):
         super().__init__()
-        self.audio_file = audio_file
+        self.signals = TranscribeTask.Signals()
+        self.audio_files = audio_files
         self.models_dir = models_dir
         self.model = model
         self.threads = threads
         self.language = language
         self.backend = backend
+        self.daemon = daemon
+        self.whisper_cli = whisper_cli
+        # Digests memoized per file so a get+put pair hashes the audio once
+        self._digests = {}
+
+    def _cache_path(self, audio_file):
+        digest = self._digests.get(audio_file)
+        if digest is None:
+            digest = self._digests[audio_file] = _audio_digest(audio_file)
+        return os.path.join(CACHE_DIR, f"{digest}-{self.model}-{self.language}.txt")
+
+    def _cache_get(self, audio_file):
+        """Return the cached transcript for identical audio, or None"""
+        try:
+            with open(self._cache_path(audio_file), "r", encoding="utf-8") as f:
+                return f.read()
+        except OSError:
+            return None
+
+    def _cache_put(self, audio_file, text):
+        """Store a transcript atomically and trim the cache to its cap"""
+        try:
+            os.makedirs(CACHE_DIR, exist_ok=True)
+            path = self._cache_path(audio_file)
+            tmp_path = path + ".tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                f.write(text)
+            os.replace(tmp_path, path)
+            _trim_cache()
+        except OSError:
+            pass
 
     def run(self):
-        txt_file = self.audio_file + ".txt"
-        if os.path.exists(txt_file):
-            os.remove(txt_file)
+        try:
+            self._run()
+        finally:
+            # Recorded WAVs are one-shot; never leak them on tmpfs, even
+            # when an error path skips delivery
+            for audio_file in self.audio_files:
+                Path(audio_file).unlink(missing_ok=True)
+
+    def _run(self):
+        # Fast path: persistent daemon keeps the model loaded between utterances
+        if self.daemon is not None and self.daemon.is_alive():
+            texts = []
+            cache_entries = []
+            for audio_file in self.audio_files:
+                text = self._cache_get(audio_file)
+                if text is None:
+                    try:
+                        text = self.daemon.transcribe(audio_file)
+                    except Exception as e:
+                        self.signals.error.emit(f"Error: {e}")
+                        return
+                    if text:
+                        cache_entries.append((audio_file, text))
+                if text:
+                    texts.append(text)
+                    self.signals.partial.emit(text)
+            self._deliver("\n".join(texts), cache_entries)
+            return
 
-        # Find whisper-cli in PATH, fallback to relative path
-        import shutil
+        # Identical audio yields identical text, so repeats skip whisper-cli
+        # entirely (batched runs can't attribute output per file, so only
+        # single-file runs consult the cache here)
+        if len(self.audio_files) == 1:
+            cached = self._cache_get(self.audio_files[0])
+            if cached is not None:
+                self._deliver(cached)
+                return
 
-        whisper_cli = shutil.which("whisper-cli")
+        # Resolved once at startup; falls back to a PATH walk if unset
+        whisper_cli = self.whisper_cli or shutil.which("whisper-cli")
 
         if not whisper_cli:
-            self.error.emit(
+            self.signals.error.emit(
                 "whisper-cli not found.\nInstall whisper.cpp or add it to PATH."
             )
             return
@@ -104,24 +436,24 @@ class TranscribeWorker(QThread):
         model_path = os.path.join(models_dir, f"ggml-{self.model}.bin")
 
         # Check if model exists
-        if not os.path.exists(model_path):
-            self.error.emit(
+        if not _model_exists(model_path):
+            self.signals.error.emit(
                 f"Model not found:\n{model_path}\n\nConfigure models directory in Settings."
             )
             return
 
         try:
-            # Build command arguments
+            # Build command arguments; all queued files go through one
+            # invocation so the model is loaded once
             cmd = [
                 whisper_cli,
-                self.audio_file,
+                *self.audio_files,
                 "-m",
                 model_path,
                 "-t",
                 self.threads,
                 "-l",
                 self.language,
-                "-otxt",
                 "-np",
             ]
 
@@ -133,44 +465,94 @@ class TranscribeWorker(QThread):
                 cmd,
                 stdout=subprocess.PIPE,
                 stderr=subprocess.PIPE,
-                text=True,
             )
-            stdout, stderr = whisper_process.communicate(timeout=120)
+
+            # Binary pipes: only stdout carries the transcript, so wrap just
+            # it for line decoding; stderr stays bytes until actually needed
+            stdout = io.TextIOWrapper(
+                whisper_process.stdout, encoding="utf-8", errors="replace"
+            )
+
+            # Drain stderr concurrently; reading it only after stdout EOF
+            # deadlocks once the child fills the ~64 KiB pipe buffer
+            stderr_chunks = []
+            stderr_thread = threading.Thread(
+                target=lambda: stderr_chunks.append(whisper_process.stderr.read()),
+                daemon=True,
+            )
+            stderr_thread.start()
+
+            # A watchdog enforces the timeout even if whisper-cli hangs
+            # without producing output (the read loop alone can't notice)
+            timed_out = threading.Event()
+
+            def _kill_on_timeout():
+                timed_out.set()
+                whisper_process.kill()
+
+            watchdog = threading.Timer(
+                120 * len(self.audio_files), _kill_on_timeout
+            )
+            watchdog.daemon = True
+            watchdog.start()
+
+            # Stream segments as they arrive instead of waiting for -otxt
+            segments = []
+            try:
+                for line in stdout:
+                    # Strip the "[hh:mm:ss.mmm --> hh:mm:ss.mmm]" segment prefix
+                    text = re.sub(r"^\[[^\]]*\]\s*", "", line).strip()
+                    if text:
+                        segments.append(text)
+                        self.signals.partial.emit(text)
+            finally:
+                watchdog.cancel()
+
+            stderr_thread.join()
+            stderr = stderr_chunks[0] if stderr_chunks else b""
+            whisper_process.wait()
+
+            if timed_out.is_set():
+                self.signals.error.emit("Transcribe timeout")
+                return
 
             # Check for errors in whisper output
             if whisper_process.returncode != 0:
-                self.error.emit(f"Whisper error:\n{stderr}")
+                self.signals.error.emit(
+                    f"Whisper error:\n{stderr.decode('utf-8', errors='replace')}"
+                )
                 return
 
-            if os.path.exists(txt_file):
-                with open(txt_file, "r", encoding="utf-8") as f:
-                    final_text = f.read().strip()
-            else:
-                final_text = ""
+            final_text = "\n".join(segments)
 
-            # Convert Traditional to Simplified Chinese
-            if final_text and self.language in ["zh", "auto"]:
-                try:
-                    import opencc
+            cache_entries = []
+            if final_text and len(self.audio_files) == 1:
+                cache_entries.append((self.audio_files[0], final_text))
 
-                    converter = opencc.OpenCC("t2s")
-                    final_text = converter.convert(final_text)
-                except:
-                    pass
+            self._deliver(final_text, cache_entries)
 
-            # Copy to clipboard
-            if final_text:
-                wl_copy_process = subprocess.Popen(
-                    ["wl-copy"], stdin=subprocess.PIPE, text=True
-                )
-                wl_copy_process.communicate(input=final_text)
+        except Exception as e:
+            self.signals.error.emit(f"Error: {e}")
 
-            self.finished.emit(final_text)
+    def _deliver(self, final_text, cache_entries=()):
+        """Post-process the transcript and emit it
 
-        except subprocess.TimeoutExpired:
-            self.error.emit("Transcribe timeout")
-        except Exception as e:
-            self.error.emit(f"Error: {e}")
+        The finished signal goes out before the cache writes (and the
+        temp-file cleanup in run's finally) so the GUI thread fills the text
+        view and clipboard while this thread finishes its disk work.
+        """
+        # Convert Traditional to Simplified Chinese. Pure-ASCII transcripts
+        # can't contain Traditional characters, so skip OpenCC for them
+        if final_text and self.language in ["zh", "auto"] and not final_text.isascii():
+            try:
+                final_text = _t2s_convert(final_text)
+            except:
+                pass
+
+        self.signals.finished.emit(final_text)
+
+        for audio_file, text in cache_entries:
+            self._cache_put(audio_file, text)
 
 
 class SettingsDialog(QDialog):
@@ -266,6 +648,13 @@ class SettingsDialog(QDialog):
         self.update_model_list(backend)
 
     def save_and_close(self):
+        old_daemon_settings = (
+            self.parent.models_dir_var,
+            self.parent.model_var,
+            self.parent.lang_var,
+            self.parent.thread_var,
+            self.parent.backend_var,
+        )
         self.parent.models_dir_var = self.dir_edit.text().strip()
         self.parent.model_var = self.model_combo.currentText()
         self.parent.lang_var = self.lang_combo.currentText()
@@ -280,10 +669,24 @@ class SettingsDialog(QDialog):
                 "backend": self.parent.backend_var,
             }
         )
+        # Restarting the daemon reloads the whole model, so only do it when
+        # a setting it actually uses changed
+        new_daemon_settings = (
+            self.parent.models_dir_var,
+            self.parent.model_var,
+            self.parent.lang_var,
+            self.parent.thread_var,
+            self.parent.backend_var,
+        )
+        if new_daemon_settings != old_daemon_settings:
+            self.parent.restart_daemon()
         self.accept()
 
 
 class VoiceInputWindow(QMainWindow):
+    # Emitted from the recording worker once the WAV has been written
+    recording_done = pyqtSignal()
+
     def __init__(self):
         super().__init__()
         self.setWindowTitle("Voice Input")
@@ -297,12 +700,38 @@ class VoiceInputWindow(QMainWindow):
         self.thread_var = self.settings["threads"]
         self.backend_var = self.settings.get("backend", "default")
 
-        self.audio_file = tempfile.mktemp(suffix=".wav", dir="/tmp")
+        self.audio_file = None
         self.recording = False
         self.recording_process = None
         self.transcribing = False
+        # Recordings finished while a transcription is running, batched later
+        self._pending = []
+
+        # Persistent whisper-cli process, avoids reloading the model per utterance
+        self.daemon = WhisperDaemon(self)
+        self.restart_daemon()
 
         self.setup_ui()
+        self.recording_done.connect(self.on_recording_done)
+
+        # Warm the page cache with the model while the user is still speaking
+        model_path = os.path.join(
+            self.models_dir_var or "whisper.cpp/models",
+            f"ggml-{self.model_var}.bin",
+        )
+        threading.Thread(
+            target=_prefetch_model, args=(model_path,), daemon=True
+        ).start()
+
+    def restart_daemon(self):
+        """(Re)start the whisper daemon with the current settings"""
+        self.daemon.start(
+            self.models_dir_var,
+            self.model_var,
+            self.thread_var,
+            self.lang_var,
+            self.backend_var,
+        )
 
     def setup_ui(self):
         central = QWidget()
@@ -337,16 +766,14 @@ class VoiceInputWindow(QMainWindow):
         # Record button
         self.record_btn = QPushButton("[ START ]")
         self.record_btn.setFont(QFont("Arial", 20, QFont.Weight.Bold))
-        self.record_btn.setStyleSheet(
-            "background-color: #4CAF50; color: white; border-radius: 10px; padding: 15px; min-width: 200px;"
-        )
+        self.record_btn.setStyleSheet(STYLE_RECORD_IDLE)
         self.record_btn.clicked.connect(self.toggle_record)
         btn_layout.addWidget(self.record_btn, alignment=Qt.AlignmentFlag.AlignCenter)
 
         # Status label
         self.status_label = QLabel("Ready")
         self.status_label.setFont(QFont("Arial", 18))
-        self.status_label.setStyleSheet("color: gray;")
+        self.status_label.setStyleSheet(STYLE_STATUS_READY)
         self.status_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         btn_layout.addWidget(self.status_label)
 
@@ -388,7 +815,7 @@ class VoiceInputWindow(QMainWindow):
         # Hint
         hint = QLabel("Press SPACE to start/stop recording")
         hint.setFont(QFont("Arial", 12))
-        hint.setStyleSheet("color: gray;")
+        hint.setStyleSheet(STYLE_STATUS_READY)
         bottom_layout.addWidget(hint)
 
         main_layout.addWidget(bottom_frame)
@@ -403,6 +830,10 @@ class VoiceInputWindow(QMainWindow):
         if self.recording_process and self.recording_process.poll() is None:
             self.recording_process.terminate()
             self.recording_process.wait()
+        self.daemon.stop()
+        # Queued recordings that will never be transcribed
+        for audio_file in self._pending:
+            Path(audio_file).unlink(missing_ok=True)
         event.accept()
 
     def open_settings(self):
@@ -418,100 +849,141 @@ class VoiceInputWindow(QMainWindow):
     def start_recording(self):
         self.recording = True
         self.record_btn.setText("[ STOP ]")
-        self.record_btn.setStyleSheet(
-            "background-color: #f44336; color: white; border-radius: 10px; padding: 15px; min-width: 200px;"
-        )
+        self.record_btn.setStyleSheet(STYLE_RECORD_ACTIVE)
         self.status_label.setText("Recording...")
-        self.status_label.setStyleSheet("color: red;")
+        self.status_label.setStyleSheet(STYLE_STATUS_ERROR)
         self.result_text.clear()
         self.copy_btn.setEnabled(False)
 
-        if os.path.exists(self.audio_file):
-            os.remove(self.audio_file)
+        # Fresh file per recording so a queued one can't clobber the file
+        # still being transcribed; mkstemp avoids mktemp's TOCTOU race
+        fd, self.audio_file = tempfile.mkstemp(suffix=".wav", dir=SPOOL_DIR)
+        os.close(fd)
 
-        self.recording_thread = threading.Thread(target=self._record_audio)
-        self.recording_thread.daemon = True
-        self.recording_thread.start()
+        QThreadPool.globalInstance().start(self._record_audio)
 
     def _record_audio(self):
         try:
+            # Capture raw PCM from arecord's stdout instead of letting it
+            # stream the WAV to disk; the file is written once on stop
             self.recording_process = subprocess.Popen(
-                ["arecord", "-f", "cd", "-d", "0", self.audio_file],
-                stdout=subprocess.DEVNULL,
+                [ARECORD or "arecord", "-f", "cd", "-t", "raw", "-d", "0", "-"],
+                stdout=subprocess.PIPE,
                 stderr=subprocess.DEVNULL,
             )
+            pcm = bytearray()
+            while True:
+                chunk = self.recording_process.stdout.read(65536)
+                if not chunk:
+                    break
+                pcm += chunk
             self.recording_process.wait()
-        except Exception as e:
-            self.status_label.setText(f"Error: {e}")
+            if pcm:
+                # 128 KiB buffer keeps the multi-MB WAV write to few syscalls
+                with open(self.audio_file, "wb", buffering=131072) as f:
+                    f.write(_wav_header(len(pcm)))
+                    f.write(pcm)
+        except Exception:
+            pass
+        self.recording_done.emit()
 
     def stop_recording(self):
         self.recording = False
         self.record_btn.setText("[ START ]")
-        self.record_btn.setStyleSheet(
-            "background-color: #4CAF50; color: white; border-radius: 10px; padding: 15px; min-width: 200px;"
-        )
+        self.record_btn.setStyleSheet(STYLE_RECORD_IDLE)
 
+        # The size check runs in on_recording_done once the WAV is flushed
         if self.recording_process:
             self.recording_process.terminate()
-            self.recording_process.wait()
 
-        if os.path.exists(self.audio_file):
-            file_size = os.path.getsize(self.audio_file)
-            if file_size > 1000:
-                self.status_label.setText("Recording done, transcribing...")
-                self.status_label.setStyleSheet("color: blue;")
-                self.transcribe()
-            else:
-                self.status_label.setText("Invalid recording")
-                self.status_label.setStyleSheet("color: orange;")
+    def on_recording_done(self):
+        if self.recording:
+            # arecord exited on its own, reset the toggle state first
+            self.stop_recording()
+
+        # One stat covers both the existence and the size check
+        try:
+            file_size = os.stat(self.audio_file).st_size
+        except FileNotFoundError:
+            file_size = -1
+
+        if file_size > 1000:
+            self.status_label.setText("Recording done, transcribing...")
+            self.status_label.setStyleSheet(STYLE_STATUS_BUSY)
+            self.transcribe()
+        elif file_size >= 0:
+            Path(self.audio_file).unlink(missing_ok=True)
+            self.status_label.setText("Invalid recording")
+            self.status_label.setStyleSheet(STYLE_STATUS_WARN)
         else:
             self.status_label.setText("Recording failed")
-            self.status_label.setStyleSheet("color: red;")
+            self.status_label.setStyleSheet(STYLE_STATUS_ERROR)
 
     def transcribe(self):
         if self.transcribing:
+            # Already busy; queue the file and batch it when the task ends
+            self._pending.append(self.audio_file)
             return
+        self._start_transcribe([self.audio_file])
+
+    def _start_transcribe(self, audio_files):
         self.transcribing = True
         self.status_label.setText("Transcribing...")
-        self.status_label.setStyleSheet("color: blue;")
+        self.status_label.setStyleSheet(STYLE_STATUS_BUSY)
         self.record_btn.setEnabled(False)
 
-        # Create worker thread
-        self.worker = TranscribeWorker(
-            audio_file=self.audio_file,
+        # Submit the task to the shared pool so threads are reused
+        self.task = TranscribeTask(
+            audio_files=audio_files,
             models_dir=self.models_dir_var,
             model=self.model_var,
             threads=self.thread_var,
             language=self.lang_var,
             backend=self.backend_var,
+            daemon=self.daemon,
+            whisper_cli=WHISPER_CLI,
         )
-        self.worker.finished.connect(self.on_transcribe_finished)
-        self.worker.error.connect(self.on_transcribe_error)
-        self.worker.start()
+        self.task.signals.partial.connect(self.result_text.append)
+        self.task.signals.finished.connect(self.on_transcribe_finished)
+        self.task.signals.error.connect(self.on_transcribe_error)
+        QThreadPool.globalInstance().start(self.task)
 
     def on_transcribe_finished(self, text):
+        # Copy to clipboard (runs in the GUI thread, no wl-copy subprocess)
+        if text:
+            QApplication.clipboard().setText(text)
         self.show_result(text)
         self.transcribing = False
         self.record_btn.setEnabled(True)
+        self._drain_pending()
 
     def on_transcribe_error(self, error_msg):
         self.status_label.setText(error_msg)
-        self.status_label.setStyleSheet("color: red;")
+        self.status_label.setStyleSheet(STYLE_STATUS_ERROR)
         self.transcribing = False
         self.record_btn.setEnabled(True)
+        self._drain_pending()
+
+    def _drain_pending(self):
+        """Batch any recordings queued while the last task was running"""
+        if self._pending and not self.transcribing:
+            audio_files = self._pending[:]
+            self._pending.clear()
+            self._start_transcribe(audio_files)
 
     def show_result(self, text):
         if text:
             self.result_text.clear()
             self.result_text.insertPlainText(text)
             self.status_label.setText("Done")
-            self.status_label.setStyleSheet("color: green;")
+            self.status_label.setStyleSheet(STYLE_STATUS_OK)
             self.copy_btn.setEnabled(True)
-            # Auto close after a short delay
-            QTimer.singleShot(500, self.close)
+            # Auto close after a short delay, unless more work is queued
+            if not self._pending:
+                QTimer.singleShot(500, self.close)
         else:
             self.status_label.setText("No text detected")
-            self.status_label.setStyleSheet("color: orange;")
+            self.status_label.setStyleSheet(STYLE_STATUS_WARN)
 
     def copy_to_clipboard(self):
         text = self.result_text.toPlainText().strip()
@@ -519,7 +991,7 @@ class VoiceInputWindow(QMainWindow):
             clipboard = QApplication.clipboard()
             clipboard.setText(text)
             self.status_label.setText("Copied!")
-            self.status_label.setStyleSheet("color: green;")
+            self.status_label.setStyleSheet(STYLE_STATUS_OK)
 
 
 def main():
@@ -540,6 +1012,15 @@ def main():
     if new_paths:
         os.environ["PATH"] = ":".join(new_paths) + ":" + current_path
 
+    # Resolve tool paths once so workers don't re-walk PATH per utterance
+    global WHISPER_CLI, ARECORD
+    WHISPER_CLI = shutil.which("whisper-cli")
+    ARECORD = shutil.which("arecord")
+
+    # Pre-warm the OpenCC converter so the first transcription doesn't pay
+    # the dictionary-load cost
+    threading.Thread(target=_get_t2s, daemon=True).start()
+
     # Set application-wide font
     font = QFont("Arial", 12)
     app.setFont(font)